@@ -7,6 +7,7 @@ Provides ORM-like interface using SQLite with better data integrity and querying
 import json
 import os
 import sqlite3
+import threading
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -22,6 +23,8 @@ class DatabaseManager:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        # One connection per thread, opened lazily by get_connection()
+        self._local = threading.local()
         self._ensure_db_dir()
         self._init_db()
 
@@ -77,7 +80,22 @@ class DatabaseManager:
             conn.commit()
 
     def get_connection(self) -> sqlite3.Connection:
-        """Get database connection with row factory"""
+        """
+        Get the calling thread's database connection with row factory.
+
+        Each thread keeps its own connection so concurrent requests don't
+        serialize on a shared handle; under WAL, readers never block behind
+        a writer. The connection is reused across calls, so callers should
+        use it as a context manager (commit/rollback) and must not close it.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection and apply the connection pragmas"""
         # Set timeout to 30 seconds to handle database locks better
         # especially on Windows with multiple processes accessing the DB
         conn = sqlite3.connect(self.db_path, timeout=30.0)
@@ -128,13 +146,24 @@ class BetRepository:
             strategy_priority = bet_data.get('strategy_priority') or opportunity.get('strategy_priority')
             round_number = bet_data.get('round_number') or opportunity.get('round_number')
 
+            # Bets can be added already settled, so derive profit as update_bet does
+            status = bet_data.get('status', 'pending')
+            stake = bet_data.get('stake')
+            odds = bet_data.get('odds')
+            if status == 'won':
+                profit = round((stake * odds) - stake, 2)
+            elif status == 'lost':
+                profit = round(-stake, 2)
+            else:
+                profit = 0.0
+
             cursor.execute('''
                 INSERT INTO bets (
                     placement_date, match_date, league, game, bet_team,
-                    bet_type, stake, odds, status, strategy, confidence,
+                    bet_type, stake, odds, status, profit, strategy, confidence,
                     reason, supporting_strategies, individual_strategies,
                     strategy_priority, round_number
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 bet_data.get('placement_date', bet_data.get('date', datetime.now().isoformat())),
                 bet_data.get('match_date') or opportunity.get('match_date'),
@@ -142,9 +171,10 @@ class BetRepository:
                 game,
                 bet_team,
                 bet_data.get('bet_type', 'WIN'),
-                bet_data.get('stake'),
-                bet_data.get('odds'),
-                bet_data.get('status', 'pending'),
+                stake,
+                odds,
+                status,
+                profit,
                 strategy,
                 confidence,
                 reason,
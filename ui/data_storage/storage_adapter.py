@@ -12,6 +12,35 @@ from typing import Any, Dict, List, Optional
 
 from .database_models import BetRepository, DatabaseManager
 
+# Number of best and worst teams reported by get_analytics()
+TEAM_RANK_SIZE = 3
+
+
+def _league_rollup(league: str, bets: int, won: int, lost: int,
+                   stake: float, profit: float) -> Dict[str, Any]:
+    """Build one settled-bets-per-league entry for the analytics payload"""
+    return {
+        'league': league,
+        'bets': bets,
+        'won': won,
+        'lost': lost,
+        'stake': round(stake, 2),
+        'profit': round(profit, 2),
+        'win_rate': round(won / bets * 100) if bets > 0 else 0,
+        'roi': round(profit / stake * 100, 2) if stake > 0 else 0
+    }
+
+
+def _team_rollup(team: str, bets: int, stake: float, profit: float) -> Dict[str, Any]:
+    """Build one settled-bets-per-team entry for the analytics payload"""
+    return {
+        'team': team,
+        'bets': bets,
+        'stake': round(stake, 2),
+        'profit': round(profit, 2),
+        'roi': round(profit / stake * 100, 2) if stake > 0 else 0
+    }
+
 
 class StorageAdapter(ABC):
     """Abstract base class for storage adapters"""
@@ -100,26 +129,57 @@ class SQLiteStorageAdapter(StorageAdapter):
         with self.db_manager.get_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute('SELECT COUNT(*) as total FROM bets')
-            total_bets = cursor.fetchone()['total']
-
-            cursor.execute("SELECT COUNT(*) as won FROM bets WHERE status = 'won'")
-            won_bets = cursor.fetchone()['won']
-
-            cursor.execute("SELECT COUNT(*) as lost FROM bets WHERE status = 'lost'")
-            lost_bets = cursor.fetchone()['lost']
-
-            cursor.execute("SELECT COUNT(*) as pending FROM bets WHERE status = 'pending'")
-            pending_bets = cursor.fetchone()['pending']
-
-            cursor.execute('SELECT COALESCE(SUM(stake), 0) as total FROM bets')
-            total_stake = cursor.fetchone()['total']
-
-            cursor.execute('SELECT COALESCE(SUM(profit), 0) as total FROM bets')
-            total_profit = cursor.fetchone()['total']
-
-            cursor.execute('SELECT COALESCE(AVG(odds), 0) as avg FROM bets')
-            average_odds = cursor.fetchone()['avg']
+            # All overall totals in a single scan of the table
+            cursor.execute('''
+                SELECT COUNT(*) AS total,
+                       COALESCE(SUM(status = 'won'), 0) AS won,
+                       COALESCE(SUM(status = 'lost'), 0) AS lost,
+                       COALESCE(SUM(status = 'pending'), 0) AS pending,
+                       COALESCE(SUM(stake), 0) AS stake,
+                       COALESCE(SUM(profit), 0) AS profit,
+                       COALESCE(AVG(odds), 0) AS avg_odds
+                FROM bets
+            ''')
+            totals = cursor.fetchone()
+            total_bets = totals['total']
+            won_bets = totals['won']
+            lost_bets = totals['lost']
+            pending_bets = totals['pending']
+            total_stake = totals['stake']
+            total_profit = totals['profit']
+            average_odds = totals['avg_odds']
+
+            # Per-league and per-team rollups over settled bets only
+            cursor.execute('''
+                SELECT COALESCE(NULLIF(league, ''), 'Unknown') AS league, COUNT(*) AS bets,
+                       SUM(status = 'won') AS won, SUM(status = 'lost') AS lost,
+                       SUM(stake) AS stake, COALESCE(SUM(profit), 0) AS profit
+                FROM bets WHERE status IN ('won', 'lost')
+                GROUP BY 1 ORDER BY 1
+            ''')
+            by_league = [
+                _league_rollup(row['league'], row['bets'], row['won'], row['lost'],
+                               row['stake'], row['profit'])
+                for row in cursor.fetchall()
+            ]
+
+            # Ties on profit are broken by team name, as in the JSON adapter
+            team_query = '''
+                SELECT COALESCE(NULLIF(bet_team, ''), 'Unknown') AS bet_team, COUNT(*) AS bets,
+                       SUM(stake) AS stake, COALESCE(SUM(profit), 0) AS profit
+                FROM bets WHERE status IN ('won', 'lost')
+                GROUP BY 1 ORDER BY profit {order}, bet_team LIMIT ?
+            '''
+            cursor.execute(team_query.format(order='DESC'), (TEAM_RANK_SIZE,))
+            by_team_top = [
+                _team_rollup(row['bet_team'], row['bets'], row['stake'], row['profit'])
+                for row in cursor.fetchall()
+            ]
+            cursor.execute(team_query.format(order='ASC'), (TEAM_RANK_SIZE,))
+            by_team_bottom = [
+                _team_rollup(row['bet_team'], row['bets'], row['stake'], row['profit'])
+                for row in cursor.fetchall()
+            ]
 
             win_rate = (won_bets / total_bets * 100) if total_bets > 0 else 0
 
@@ -132,7 +192,10 @@ class SQLiteStorageAdapter(StorageAdapter):
                 'total_stake': round(total_stake, 2),
                 'total_profit': round(total_profit, 2),
                 'average_odds': round(average_odds, 2),
-                'roi': round((total_profit / total_stake * 100) if total_stake > 0 else 0, 1)
+                'roi': round((total_profit / total_stake * 100) if total_stake > 0 else 0, 1),
+                'by_league': by_league,
+                'by_team_top': by_team_top,
+                'by_team_bottom': by_team_bottom
             }
 
     def migrate_from_json(self, json_file_path: str) -> bool:
@@ -240,17 +303,55 @@ class JSONStorageAdapter(StorageAdapter):
         """Get analytics from JSON data"""
         bets = self._load_data()
         total_bets = len(bets)
-        won_bets = len([b for b in bets if b.get('status') == 'won'])
-        lost_bets = len([b for b in bets if b.get('status') == 'lost'])
-        pending_bets = len([b for b in bets if b.get('status') == 'pending'])
-
-        total_stake = sum(b.get('stake', 0) for b in bets)
-        total_profit = sum(b.get('profit', 0) for b in bets)
-
-        avg_odds = sum(b.get('odds', 0) for b in bets) / total_bets if total_bets > 0 else 0
+        status_counts = {'won': 0, 'lost': 0, 'pending': 0}
+        total_stake = 0
+        total_profit = 0
+        total_odds = 0
+
+        # One pass for the overall totals and the settled per-league/per-team rollups
+        leagues = {}
+        teams = {}
+        for b in bets:
+            status = b.get('status')
+            stake = b.get('stake', 0)
+            profit = b.get('profit', 0)
+            total_stake += stake
+            total_profit += profit
+            total_odds += b.get('odds', 0)
+            if status in status_counts:
+                status_counts[status] += 1
+            if status not in ('won', 'lost'):
+                continue
+
+            opportunity = b.get('opportunity', {})
+            league = b.get('league') or opportunity.get('league') or 'Unknown'
+            team = b.get('bet_team') or opportunity.get('bet_team') or 'Unknown'
+
+            entry = leagues.setdefault(league, [0, 0, 0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1 if status == 'won' else 2] += 1
+            entry[3] += stake
+            entry[4] += profit
+
+            entry = teams.setdefault(team, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += stake
+            entry[2] += profit
+
+        won_bets = status_counts['won']
+        lost_bets = status_counts['lost']
+        pending_bets = status_counts['pending']
+        avg_odds = total_odds / total_bets if total_bets > 0 else 0
         win_rate = (won_bets / total_bets * 100) if total_bets > 0 else 0
         roi = (total_profit / total_stake * 100) if total_stake > 0 else 0
 
+        by_league = [_league_rollup(league, *leagues[league]) for league in sorted(leagues)]
+        # Best and worst by profit, ties broken by team name in both lists
+        best = sorted(teams.items(), key=lambda item: (-item[1][2], item[0]))
+        worst = sorted(teams.items(), key=lambda item: (item[1][2], item[0]))
+        by_team_top = [_team_rollup(team, *entry) for team, entry in best[:TEAM_RANK_SIZE]]
+        by_team_bottom = [_team_rollup(team, *entry) for team, entry in worst[:TEAM_RANK_SIZE]]
+
         return {
             'total_bets': total_bets,
             'won_bets': won_bets,
@@ -260,7 +361,10 @@ class JSONStorageAdapter(StorageAdapter):
             'total_stake': round(total_stake, 2),
             'total_profit': round(total_profit, 2),
             'average_odds': round(avg_odds, 2),
-            'roi': round(roi, 1)
+            'roi': round(roi, 1),
+            'by_league': by_league,
+            'by_team_top': by_team_top,
+            'by_team_bottom': by_team_bottom
         }
 
 
@@ -0,0 +1,1709 @@
+// Diagnostic logging; flip DEBUG to trace analytics renders in the console
+const DEBUG = false;
+const dlog = DEBUG ? console.log.bind(console) : () => {};
+
+let opportunities = [];
+let activeBets = [];
+let completedBets = [];
+let currentDateFilter = 'all';  // Track current filter state
+let currentLeagueFilter = 'all'; // Track current league filter
+let oppIndex = new Map();        // opportunityKey -> index in opportunities
+let betKeySet = new Set();       // opportunityKey of every active/completed bet
+const activeBetsById = new Map();     // bet id -> bet, mirrors activeBets
+const completedBetsById = new Map();  // bet id -> bet, mirrors completedBets
+// Running analytics totals, kept in step with every bet added, removed or settled
+const agg = { totalStake: 0, pendingStake: 0, potentialProfit: 0, totalProfit: 0, wonCount: 0, completedCount: 0 };
+const weekendStats = {};  // weekend label -> running per-weekend stats, updated alongside agg
+let betsVersion = 0;      // bumped on every bet mutation (they all go through aggApply/rebuildAgg)
+let _weekendsRenderedVersion = -1;  // betsVersion the weekend cards/summary were drawn at
+let serverAnalytics = null;      // last /api/analytics payload, with the league/team rollups
+let analyticsVersion = 0;        // bumped whenever serverAnalytics is replaced
+let analyticsRequestSeq = 0;     // only the newest /api/analytics response is kept
+let _breakdownsRenderedVersion = -1;  // analyticsVersion the league/team breakdowns were drawn at
+let uniqueDates = [];            // sorted distinct match dates of opportunities
+let _dateOptionsKey = null;      // uniqueDates the date dropdown was last built from
+const refs = {};                 // DOM nodes looked up once on DOMContentLoaded
+let activeTab = 'opportunities'; // data-tab name of the visible tab
+let betsDirty = true;            // bets list DOM is out of date with activeBets
+let analyticsDirty = true;       // analytics DOM is out of date with the bet arrays
+let betsScrollQueued = false;    // a bets-list window render is pending for the next frame
+let filtersDirty = false;        // opportunity cards need re-rendering with the current filters
+let uiFrame = 0;                 // requestAnimationFrame id of a pending flushUi
+
+// Identity of an opportunity (game + team + league)
+function opportunityKey(opp) {
+    return `${opp.game}|${opp.bet_team}|${opp.league}`;
+}
+
+// Rebuild the key -> index map; call whenever opportunities is reassigned
+function rebuildOppIndex() {
+    oppIndex = new Map();
+    opportunities.forEach((opp, i) => {
+        const key = opportunityKey(opp);
+        if (!oppIndex.has(key)) oppIndex.set(key, i);
+    });
+}
+
+// Recompute the distinct match dates; call whenever opportunities is reassigned
+function rebuildUniqueDates() {
+    const dates = new Set();
+    for (const opp of opportunities) dates.add(opp.match_date);
+    uniqueDates = [...dates].sort();
+}
+
+// Date filtering functions
+function populateDateFilter() {
+    const dateFilter = refs.dateFilter;
+
+    // Only rebuild the options when the set of dates actually changed
+    const optionsKey = JSON.stringify(uniqueDates);
+    if (optionsKey !== _dateOptionsKey) {
+        _dateOptionsKey = optionsKey;
+
+        // Clear existing options except "All Dates"
+        dateFilter.innerHTML = '<option value="all">All Dates</option>';
+
+        // Add date options
+        uniqueDates.forEach(date => {
+            const option = document.createElement('option');
+            option.value = date;  // Keep the raw date value for filtering
+            option.textContent = formatDateForDisplay(date);  // Display formatted date
+            dateFilter.appendChild(option);
+        });
+    }
+
+    // Preserve current selection if still valid
+    if ([...dateFilter.options].some(o => o.value === currentDateFilter)) {
+        dateFilter.value = currentDateFilter;
+    }
+}
+
+// Shared formatter and memo for formatDateForDisplay
+const _dateFmt = new Intl.DateTimeFormat('en-US', {
+    weekday: 'short',
+    year: 'numeric',
+    month: 'short',
+    day: 'numeric'
+});
+const _dateFmtCache = new Map();
+const DATE_FMT_CACHE_MAX = 512;
+
+function formatDateForDisplay(dateStr) {
+    if (!dateStr || dateStr === 'Unknown') return 'Unknown Date';
+
+    const cached = _dateFmtCache.get(dateStr);
+    if (cached !== undefined) return cached;
+
+    let formatted;
+    try {
+        let date;
+        const parts = dateStr.includes('/') ? dateStr.split('/') : null;
+        if (parts && parts.length === 3) {
+            // Handle DD/MM/YYYY format
+            date = new Date(parts[2], parts[1] - 1, parts[0]);
+        } else {
+            // Handle YYYY-MM-DD format
+            date = new Date(dateStr);
+        }
+        formatted = _dateFmt.format(date);
+    } catch (e) {
+        formatted = dateStr;
+    }
+
+    // FIFO eviction keeps the memo bounded
+    if (_dateFmtCache.size >= DATE_FMT_CACHE_MAX) {
+        _dateFmtCache.delete(_dateFmtCache.keys().next().value);
+    }
+    _dateFmtCache.set(dateStr, formatted);
+    return formatted;
+}
+
+// Inputs of the last filtered render, so repeat renders of the same state are skipped
+let _lastFilterRender = null;
+
+// Render opportunities matching both filters in one pass
+function renderFilteredOpportunities(dateSel, leagueSel) {
+    // Skip when filters, opportunities and placed bets are all unchanged
+    // (opportunities and betKeySet are replaced, never mutated, when they change)
+    const last = _lastFilterRender;
+    if (last && last.dateSel === dateSel && last.leagueSel === leagueSel &&
+        last.opportunities === opportunities && last.betKeySet === betKeySet) {
+        return;
+    }
+    _lastFilterRender = { dateSel, leagueSel, opportunities, betKeySet };
+
+    const filtered = (dateSel === 'all' && leagueSel === 'all')
+        ? opportunities
+        : opportunities.filter(opp =>
+            (dateSel === 'all' || opp.match_date === dateSel) &&
+            (leagueSel === 'all' || opp.league === leagueSel));
+    displayOpportunities(filtered);
+}
+
+function applyFilters() {
+    // Persist current selections
+    currentDateFilter = refs.dateFilter.value;
+    currentLeagueFilter = refs.leagueFilter.value;
+    renderFilteredOpportunities(currentDateFilter, currentLeagueFilter);
+}
+
+// Reapply current filters (used after add/delete/mark bet)
+function reapplyFilters() {
+    // Ensure dropdowns reflect selection
+    refs.dateFilter.value = currentDateFilter;
+    refs.leagueFilter.value = currentLeagueFilter;
+    renderFilteredOpportunities(currentDateFilter, currentLeagueFilter);
+}
+
+function clearFilters() {
+    refs.dateFilter.value = 'all';
+    refs.leagueFilter.value = 'all';
+    currentDateFilter = 'all';
+    currentLeagueFilter = 'all';
+    renderFilteredOpportunities('all', 'all');
+}
+
+// Initialize the app
+document.addEventListener('DOMContentLoaded', function() {
+    refs.dateFilter = document.getElementById('date-filter');
+    refs.leagueFilter = document.getElementById('league-filter');
+    refs.grid = document.getElementById('opportunities-grid');
+    refs.betsList = document.getElementById('bets-list');
+    refs.betsEmpty = refs.betsList.querySelector('.bets-empty');
+    refs.betsSpacer = refs.betsList.querySelector('.bets-spacer');
+    refs.betsWindow = refs.betsList.querySelector('.bets-window');
+
+    // Tab buttons and their content panels, keyed by data-tab name
+    refs.tabs = {};
+    document.querySelectorAll('.tab[data-tab]').forEach(btn => {
+        refs.tabs[btn.dataset.tab] = { btn, content: document.getElementById(btn.dataset.tab) };
+    });
+    document.querySelector('.tabs').addEventListener('click', e => {
+        const btn = e.target.closest('.tab[data-tab]');
+        if (btn) showTab(btn.dataset.tab);
+    });
+
+    // One delegated listener handles every button on every opportunity card
+    refs.grid.addEventListener('click', e => {
+        const button = e.target.closest('button[data-action]');
+        if (!button) return;
+        const card = button.closest('.opportunity-card');
+        const index = Number(button.dataset.index);
+        switch (button.dataset.action) {
+            case 'add': addBet(index, card); break;
+            case 'add-won': addBetAndMarkWon(index, card); break;
+            case 'add-lost': addBetAndMarkLost(index, card); break;
+            case 'toggle': toggleStrategyDetails(card); break;
+        }
+    });
+
+    // Analytics summary values, written by renderAnalytics
+    refs.settledBets = document.getElementById('settled-bets');
+    refs.winRate = document.getElementById('win-rate');
+    refs.settledStake = document.getElementById('settled-stake');
+    refs.totalProfit = document.getElementById('total-profit');
+    refs.totalRoi = document.getElementById('total-roi');
+    refs.pendingBets = document.getElementById('pending-bets');
+    refs.pendingStake = document.getElementById('pending-stake');
+    refs.potentialProfit = document.getElementById('potential-profit');
+    refs.totalBets = document.getElementById('total-bets');
+
+    // Analytics sections rebuilt on each analytics render
+    refs.perfSummary = document.getElementById('performance-summary-content');
+    refs.leagueBreakdown = document.getElementById('league-breakdown-content');
+    refs.topTeams = document.getElementById('top-teams-content');
+    refs.bottomTeams = document.getElementById('bottom-teams-content');
+
+    // Expand/collapse buttons on the weekend analytics cards
+    refs.roundAnalytics = document.getElementById('round-analytics');
+    refs.roundAnalytics.addEventListener('click', e => {
+        const button = e.target.closest('button[data-action="toggle-weekend"]');
+        if (button) toggleWeekendBets(button.closest('.round-card'));
+    });
+
+    // One delegated listener handles Won/Lost/Delete on every pooled bet row
+    refs.betsList.addEventListener('click', e => {
+        const button = e.target.closest('button[data-action]');
+        if (!button) return;
+        const betId = Number(button.closest('.bet-row').dataset.betId);
+        switch (button.dataset.action) {
+            case 'won': markBetWon(betId); break;
+            case 'lost': markBetLost(betId); break;
+            case 'delete': deleteBet(betId); break;
+        }
+    });
+
+    // Re-render the visible slice of active bets at most once per frame
+    refs.betsList.addEventListener('scroll', scheduleBetsWindow, { passive: true });
+    window.addEventListener('resize', resizeBetsWindow);
+
+    // Both requests go out together; once both have landed the cards are
+    // re-rendered so bet-placed badges are right whichever arrived first
+    const betsLoaded = loadBets().then(() => markDirty(DIRTY_BETS | DIRTY_ANALYTICS));
+    loadAnalytics();
+    Promise.all([loadOpportunities(), betsLoaded]).then(() => markDirty(DIRTY_FILTERS));
+});
+
+// Tab switching
+function showTab(tabName) {
+    // Only the previously active and the newly selected tab change
+    const previous = refs.tabs[activeTab];
+    previous.btn.classList.remove('active');
+    previous.content.classList.remove('active');
+
+    const selected = refs.tabs[tabName];
+    selected.btn.classList.add('active');
+    selected.content.classList.add('active');
+    activeTab = tabName;
+
+    // Draw the newly visible tab if bets changed while it was hidden
+    markDirty(0);
+}
+
+// Bits for markDirty: which bet-derived views a mutation made stale
+const DIRTY_BETS = 1;
+const DIRTY_ANALYTICS = 2;
+const DIRTY_FILTERS = 4;
+
+// Record stale views and redraw them together on the next frame, so a burst
+// of mutations costs one render per view
+function markDirty(bits) {
+    if (bits & DIRTY_BETS) betsDirty = true;
+    if (bits & DIRTY_ANALYTICS) analyticsDirty = true;
+    if (bits & DIRTY_FILTERS) filtersDirty = true;
+    if (!uiFrame) uiFrame = requestAnimationFrame(flushUi);
+}
+
+// Hidden tabs keep their dirty flag and are drawn when showTab reveals them
+function flushUi() {
+    uiFrame = 0;
+    if (filtersDirty) {
+        filtersDirty = false;
+        reapplyFilters();
+    }
+    if (activeTab === 'bets' && betsDirty) updateBetsDisplay();
+    if (activeTab === 'analytics' && analyticsDirty) renderAnalytics();
+}
+
+// Load betting opportunities
+async function loadOpportunities() {
+    try {
+        const response = await fetch('/api/opportunities');
+        if (!response.ok) {
+            throw new Error('Failed to load opportunities');
+        }
+        opportunities = await response.json();
+        rebuildOppIndex();
+        rebuildUniqueDates();
+        populateDateFilter(); // Populate the date filter
+        displayOpportunities();
+    } catch (error) {
+        console.error('Error loading opportunities:', error);
+        showError('Failed to load betting opportunities. Please try again later.');
+    }
+}
+
+// Display opportunities
+function displayOpportunities(opportunitiesToShow = null) {
+    const grid = refs.grid;
+    const opportunitiesToDisplay = opportunitiesToShow || opportunities;
+
+    if (opportunitiesToDisplay.length === 0) {
+        grid.innerHTML = '<p>No betting opportunities available for the selected date.</p>';
+        return;
+    }
+
+    // Index the cards already in the grid so unchanged ones can be reused
+    const existing = new Map();
+    for (const card of grid.children) {
+        if (card.dataset.key) existing.set(card.dataset.key, card);
+    }
+
+    const canReuse = existing.size > 0;
+
+    const cards = opportunitiesToDisplay.map(opp => {
+        const key = opportunityKey(opp);
+        // Find the actual index in the full opportunities array
+        const actualIndex = oppIndex.get(key);
+        const card = existing.get(key);
+        if (card &&
+            card.dataset.index === String(actualIndex) &&
+            card.dataset.betPlaced === String(hasBetOnOpportunity(opp))) {
+            existing.delete(key);
+            return card;
+        }
+        return createOpportunityCard(opp, actualIndex);
+    });
+
+    if (!canReuse) {
+        // Nothing to reuse: build off-document and swap in with one DOM write
+        const frag = document.createDocumentFragment();
+        cards.forEach(card => frag.appendChild(card));
+        grid.replaceChildren(frag);
+        return;
+    }
+
+    // Keyed update: cards already in place are left untouched (keeping any
+    // typed odds/stake and focus), others are moved or inserted, leftovers removed
+    let cursor = grid.firstChild;
+    for (const card of cards) {
+        if (card === cursor) {
+            cursor = cursor.nextSibling;
+        } else {
+            grid.insertBefore(card, cursor);
+        }
+    }
+    while (cursor) {
+        const next = cursor.nextSibling;
+        grid.removeChild(cursor);
+        cursor = next;
+    }
+}
+
+// Rebuild the set of bet keys; call whenever bets are added or removed
+function rebuildBetKeySet() {
+    betKeySet = new Set();
+    const addKeys = bet => betKeySet.add(opportunityKey(bet));
+    activeBets.forEach(addKeys);
+    completedBets.forEach(addKeys);
+}
+
+// Rebuild the id -> bet maps; call whenever activeBets/completedBets is reassigned
+function rebuildBetMaps() {
+    activeBetsById.clear();
+    completedBetsById.clear();
+    activeBets.forEach(bet => activeBetsById.set(bet.id, bet));
+    completedBets.forEach(bet => completedBetsById.set(bet.id, bet));
+}
+
+// Add (sign = 1) or remove (sign = -1) one bet's contribution to agg
+function aggApply(bet, sign) {
+    betsVersion++;
+    agg.totalStake += sign * bet.stake;
+    if (bet.status === 'won' || bet.status === 'lost') {
+        agg.completedCount += sign;
+        agg.totalProfit += sign * (bet.profit || 0);
+        if (bet.status === 'won') agg.wonCount += sign;
+    } else {
+        agg.pendingStake += sign * bet.stake;
+        agg.potentialProfit += sign * ((bet.stake * bet.odds) - bet.stake);
+    }
+    weekendApply(bet, sign);
+}
+
+// Add (sign = 1) or remove (sign = -1) one bet's contribution to its weekend
+function weekendApply(bet, sign) {
+    // Use bet placement date instead of match date for weekend grouping
+    const betDate = bet.placement_date || bet.date || 'Unknown';
+    const weekend = getWeekendLabel(betDate);
+
+    let stats = weekendStats[weekend];
+    if (!stats) {
+        if (sign < 0) return;
+        stats = weekendStats[weekend] = {
+            totalBets: 0,
+            wonBets: 0,
+            totalStake: 0,
+            totalProfit: 0,
+            activeBets: 0,
+            completedBets: 0,
+            matchDate: betDate,
+            leagues: new Map(),  // league -> number of bets, so removals can drop it
+            bets: new Set()      // the bets themselves, for the expanded card list
+        };
+    }
+
+    if (sign > 0) {
+        stats.bets.add(bet);
+    } else {
+        stats.bets.delete(bet);
+    }
+
+    // Stakes and settled profits are whole pence, so snapping keeps the sums exact
+    stats.totalBets += sign;
+    stats.totalStake = roundPence(stats.totalStake + sign * bet.stake);
+
+    // Track leagues for this weekend
+    const league = bet.league;
+    if (league) {
+        const count = (stats.leagues.get(league) || 0) + sign;
+        if (count > 0) {
+            stats.leagues.set(league, count);
+        } else {
+            stats.leagues.delete(league);
+        }
+    }
+
+    if (bet.status === 'won' || bet.status === 'lost') {
+        if (bet.status === 'won') stats.wonBets += sign;
+        stats.totalProfit = roundPence(stats.totalProfit + sign * (bet.profit || 0));
+        stats.completedBets += sign;
+    } else {
+        stats.activeBets += sign;
+    }
+
+    if (stats.totalBets === 0) delete weekendStats[weekend];
+}
+
+// Recompute agg from scratch; call whenever activeBets/completedBets is reassigned
+function rebuildAgg() {
+    betsVersion++;
+    for (const key in agg) agg[key] = 0;
+    for (const weekend in weekendStats) delete weekendStats[weekend];
+    activeBets.forEach(bet => aggApply(bet, 1));
+    completedBets.forEach(bet => aggApply(bet, 1));
+}
+
+// Remove a bet from one of the bet lists and its id map
+function removeBet(list, byId, bet) {
+    const idx = list.indexOf(bet);
+    if (idx !== -1) list.splice(idx, 1);
+    byId.delete(bet.id);
+}
+
+// Check if opportunity already has a bet placed
+function hasBetOnOpportunity(opportunity) {
+    return betKeySet.has(opportunityKey(opportunity));
+}
+
+// Create opportunity card from the #opp-card-tpl skeleton
+const oppCardTemplate = document.getElementById('opp-card-tpl');
+
+function createOpportunityCard(opportunity, index) {
+    const card = oppCardTemplate.content.firstElementChild.cloneNode(true);
+    const part = selector => card.querySelector(selector);
+    const hasExistingBet = hasBetOnOpportunity(opportunity);
+
+    // Add visual indicator for existing bets and drop the parts that don't apply
+    if (hasExistingBet) {
+        card.classList.add('bet-placed');
+        card.style.border = '2px solid #27ae60';
+        card.style.backgroundColor = '#f8fff8';
+        part('.bet-inputs').remove();
+        part('.bet-actions').remove();
+    } else {
+        part('.bet-placed-badge').remove();
+        part('.bet-placed-notice').remove();
+    }
+
+    // Identity and render state, used by displayOpportunities to reuse cards
+    card.dataset.key = opportunityKey(opportunity);
+    card.dataset.index = String(index);
+    card.dataset.betPlaced = String(hasExistingBet);
+
+    part('.league-badge').textContent = opportunity.league;
+    part('.confidence-badge').textContent = `${Math.round(opportunity.confidence * 100)}%`;
+    const strategyBadge = part('.strategy-badge');
+    strategyBadge.style.background = getStrategyColor(opportunity.strategy);
+    strategyBadge.textContent = opportunity.strategy.toUpperCase();
+
+    part('.game-title').textContent = opportunity.game;
+    part('.bet-team').textContent = opportunity.bet_team;
+    part('.bet-type').textContent = opportunity.bet_type;
+    part('.bet-strategy').textContent = opportunity.strategy;
+    part('.round-number').textContent = opportunity.round_number || 'Unknown';
+    part('.match-date').textContent = opportunity.match_date || 'TBD';
+    part('.bet-reason').textContent = opportunity.reason;
+
+    // The strategy breakdown is rendered on first expand (see toggleStrategyDetails)
+    part('.strategy-details').dataset.stratPending = '1';
+
+    // Delegated click handler reads the opportunity index from the button
+    card.querySelectorAll('button[data-action]').forEach(button => {
+        button.dataset.index = String(index);
+    });
+    return card;
+}
+
+// Strategies shown in the breakdown, in display order
+const STRATEGY_LABELS = [
+    ['momentum', 'Momentum'],
+    ['form', 'Form'],
+    ['top_bottom', 'Top-Bottom'],
+    ['home_away', 'Home-Away']
+];
+
+// Helper function to create strategy details HTML
+function createStrategyDetailsHTML(individualStrategies) {
+    const parts = ['<div style="font-size: 13px;">'];
+    for (const [key, label] of STRATEGY_LABELS) {
+        const strategy = individualStrategies[key] || {};
+        parts.push(`<div style="margin-bottom: 10px;">
+        <strong>${label}:</strong> ${strategy.bet_team || 'None'} (Confidence: ${Math.round((strategy.confidence || 0) * 100)}%)<br>
+        <span style="color: #6c757d; font-size: 12px;">${strategy.reason || 'No reason provided'}</span>
+    </div>`);
+    }
+    parts.push('</div>');
+    return parts.join('');
+}
+
+// Helper function to get strategy color
+function getStrategyColor(strategy) {
+    const colors = {
+        'momentum': '#e74c3c',
+        'form': '#f39c12', 
+        'top_bottom': '#9b59b6',
+        'home_away': '#3498db',
+        'weighted': '#2ecc71'
+    };
+    return colors[strategy] || '#6c757d';
+}
+
+// Toggle strategy details
+function toggleStrategyDetails(card) {
+    const details = card.querySelector('.strategy-details');
+    const button = details.previousElementSibling;
+
+    if (details.style.display === 'none') {
+        // Build the breakdown the first time this card is expanded
+        if (details.dataset.stratPending) {
+            const opportunity = opportunities[Number(card.dataset.index)];
+            details.innerHTML = createStrategyDetailsHTML(opportunity.individual_strategies || {});
+            delete details.dataset.stratPending;
+        }
+        details.style.display = 'block';
+        button.innerHTML = 'Strategy Analysis ▲';
+    } else {
+        details.style.display = 'none';
+        button.innerHTML = 'Strategy Analysis ▼';
+    }
+}
+
+// Fractional odds such as "8/11" or "5 / 2"
+const FRAC_RE = /^(\d+(?:\.\d+)?)\s*\/\s*(\d+(?:\.\d+)?)$/;
+
+// Convert fractional odds to decimal odds
+function convertFractionalOdds(fractionalOdds) {
+    if (typeof fractionalOdds === 'number') {
+        return Math.round(fractionalOdds * 1000) / 1000; // Round to 3 decimal places
+    }
+
+    const oddsStr = fractionalOdds.toString().trim();
+    if (oddsStr === '') return null;
+
+    // Check if it's fractional format (e.g., "8/11", "2/1")
+    const match = FRAC_RE.exec(oddsStr);
+    if (match) {
+        const denominator = +match[2];
+        return denominator > 0
+            ? Math.round(((+match[1] / denominator) + 1) * 1000) / 1000 // Round to 3 decimal places
+            : null;
+    }
+
+    // Try to parse as decimal
+    const decimal = +oddsStr;
+    return isFinite(decimal) ? Math.round(decimal * 1000) / 1000 : null; // Round to 3 decimal places
+}
+
+// UI-side profit of a settled bet, to the penny; the backend recomputes it on save
+function calcProfit(stake, odds, status) {
+    if (status === 'won') return roundPence((stake * odds) - stake);
+    if (status === 'lost') return roundPence(-stake);
+    return 0;
+}
+
+// Temporary id for a new bet until POST /api/bets returns its database id.
+// Ids stay in the Date.now() range (clear of the database's small autoincrement
+// ids) but never repeat, even for two bets added within the same millisecond
+let _lastBetId = 0;
+
+function newBetId() {
+    _lastBetId = Math.max(Date.now(), _lastBetId + 1);
+    return _lastBetId;
+}
+
+// Add bet functions
+async function addBet(index, card) {
+    const opportunity = opportunities[index];
+    const oddsEl = card.querySelector('.odds-input');
+    const stakeEl = card.querySelector('.stake-input');
+    const oddsInput = oddsEl.value.trim();
+    const stake = parseFloat(stakeEl.value);
+
+    if (!oddsInput || !stake) {
+        alert('Please enter both odds and stake amount.');
+        return;
+    }
+
+    const odds = convertFractionalOdds(oddsInput);
+    if (!odds || odds < 1.01) {
+        alert('Please enter valid odds (e.g., 2.5 or 8/11).');
+        return;
+    }
+
+    const bet = {
+        id: newBetId(),
+        opportunity: opportunity,
+        league: opportunity.league,
+        game: opportunity.game,
+        bet_team: opportunity.bet_team,
+        odds: odds,
+        stake: stake,
+        status: 'pending',
+        date: new Date().toISOString(),
+        placement_date: new Date().toISOString(),
+        match_date: opportunity.match_date
+    };
+
+    // Add to in-memory list
+    activeBets.push(bet);
+    activeBetsById.set(bet.id, bet);
+    aggApply(bet, 1);
+    rebuildBetKeySet();
+
+    // Try to persist to server; if it fails, revert and show error
+    const saved = await createBet(bet);
+    if (saved) {
+        markDirty(DIRTY_BETS | DIRTY_ANALYTICS | DIRTY_FILTERS);
+
+        // Clear inputs
+        oddsEl.value = '';
+        stakeEl.value = '';
+
+        alert('Bet added successfully!');
+    } else {
+        // Revert the in-memory change
+        removeBet(activeBets, activeBetsById, bet);
+        aggApply(bet, -1);
+        rebuildBetKeySet();
+        markDirty(DIRTY_BETS | DIRTY_ANALYTICS);
+        alert('Failed to save bet to the server. Check server logs or try again.');
+    }
+}
+
+async function addBetAndMarkWon(index, card) {
+    const opportunity = opportunities[index];
+    const oddsEl = card.querySelector('.odds-input');
+    const stakeEl = card.querySelector('.stake-input');
+    const oddsInput = oddsEl.value.trim();
+    const stake = parseFloat(stakeEl.value);
+
+    if (!oddsInput || !stake) {
+        alert('Please enter both odds and stake amount.');
+        return;
+    }
+
+    const odds = convertFractionalOdds(oddsInput);
+    if (!odds || odds < 1.01) {
+        alert('Please enter valid odds (e.g., 2.5 or 8/11).');
+        return;
+    }
+
+    const bet = {
+        id: newBetId(),
+        opportunity: opportunity,
+        league: opportunity.league,
+        game: opportunity.game,
+        bet_team: opportunity.bet_team,
+        odds: odds,
+        stake: stake,
+        status: 'won',
+        result: 'Won',
+        profit: calcProfit(stake, odds, 'won'),
+        date: new Date().toISOString(),
+        placement_date: new Date().toISOString(),
+        match_date: opportunity.match_date
+    };
+
+    completedBets.push(bet);
+    completedBetsById.set(bet.id, bet);
+    aggApply(bet, 1);
+    rebuildBetKeySet();
+
+    const saved = await createBet(bet);
+    if (saved) {
+        markDirty(DIRTY_BETS | DIRTY_ANALYTICS | DIRTY_FILTERS);
+
+        // Clear inputs
+        oddsEl.value = '';
+        stakeEl.value = '';
+
+        alert('Bet added and marked as won!');
+    } else {
+        // Revert
+        removeBet(completedBets, completedBetsById, bet);
+        aggApply(bet, -1);
+        rebuildBetKeySet();
+        markDirty(DIRTY_BETS | DIRTY_ANALYTICS);
+        alert('Failed to save bet to the server. Check server logs or try again.');
+    }
+}
+
+async function addBetAndMarkLost(index, card) {
+    const opportunity = opportunities[index];
+    const oddsEl = card.querySelector('.odds-input');
+    const stakeEl = card.querySelector('.stake-input');
+    const oddsInput = oddsEl.value.trim();
+    const stake = parseFloat(stakeEl.value);
+
+    if (!oddsInput || !stake) {
+        alert('Please enter both odds and stake amount.');
+        return;
+    }
+
+    const odds = convertFractionalOdds(oddsInput);
+    if (!odds || odds < 1.01) {
+        alert('Please enter valid odds (e.g., 2.5 or 8/11).');
+        return;
+    }
+
+    const bet = {
+        id: newBetId(),
+        opportunity: opportunity,
+        league: opportunity.league,
+        game: opportunity.game,
+        bet_team: opportunity.bet_team,
+        odds: odds,
+        stake: stake,
+        status: 'lost',
+        result: 'Lost',
+        profit: calcProfit(stake, odds, 'lost'),
+        date: new Date().toISOString(),
+        placement_date: new Date().toISOString(),
+        match_date: opportunity.match_date
+    };
+
+    completedBets.push(bet);
+    completedBetsById.set(bet.id, bet);
+    aggApply(bet, 1);
+    rebuildBetKeySet();
+
+    const saved = await createBet(bet);
+    if (saved) {
+        markDirty(DIRTY_BETS | DIRTY_ANALYTICS | DIRTY_FILTERS);
+
+        // Clear inputs
+        oddsEl.value = '';
+        stakeEl.value = '';
+
+        alert('Bet added and marked as lost!');
+    } else {
+        // Revert
+        removeBet(completedBets, completedBetsById, bet);
+        aggApply(bet, -1);
+        rebuildBetKeySet();
+        markDirty(DIRTY_BETS | DIRTY_ANALYTICS);
+        alert('Failed to save bet to the server. Check server logs or try again.');
+    }
+}
+
+// Load and save bets using file-based storage
+async function loadBets() {
+    try {
+        const response = await fetch('/api/bets');
+        if (response.ok) {
+            const allBets = await response.json();
+            allBets.forEach(normalizeBet);
+
+            activeBets = allBets.filter(bet => bet.status === 'pending');
+            completedBets = allBets.filter(bet => bet.status === 'won' || bet.status === 'lost');
+            rebuildBetMaps();
+            rebuildAgg();
+            rebuildBetKeySet();
+         }
+     } catch (error) {
+         console.error('Error loading bets:', error);
+     }
+ }
+
+// Fetch the server-side rollups; the ETag turns an unchanged database into a 304
+async function loadAnalytics() {
+    const seq = ++analyticsRequestSeq;
+    try {
+        const response = await fetch('/api/analytics');
+        if (!response.ok) return;
+        const data = await response.json();
+        // A slower, older response must not overwrite a newer one
+        if (seq !== analyticsRequestSeq) return;
+        serverAnalytics = data;
+        analyticsVersion++;
+        markDirty(DIRTY_ANALYTICS);
+    } catch (error) {
+        console.error('Error loading analytics:', error);
+    }
+}
+
+// Normalize a loaded bet once so every consumer reads flat fields: the
+// server returns flat rows, older saves nest them under bet.opportunity
+function normalizeBet(bet) {
+    const opp = bet.opportunity;
+    bet.league = bet.league || opp?.league || 'Unknown';
+    bet.game = bet.game || opp?.game || 'Unknown';
+    bet.bet_team = bet.bet_team || opp?.bet_team || 'Unknown';
+    // Lowercase and trim status values so comparisons are robust
+    if (bet.status && typeof bet.status === 'string') {
+        bet.status = bet.status.trim().toLowerCase();
+    }
+}
+
+// Send one JSON request to the bets API; resolves to the parsed reply, or null
+// on any failure. keepalive lets small updates finish if the page is closing
+async function betsRequest(method, url, body, keepalive = false) {
+    try {
+        const options = { method, keepalive };
+        if (body !== undefined) {
+            options.headers = { 'Content-Type': 'application/json' };
+            options.body = JSON.stringify(body);
+        }
+        const response = await fetch(url, options);
+        if (!response.ok) {
+            console.error('Error saving bets, server responded with status', response.status);
+            try {
+                const text = await response.text();
+                console.error('Server response body:', text);
+            } catch (e) {}
+            return null;
+        }
+        const data = await response.json();
+        if (data && data.success) {
+            // Any saved change may move the league and team rollups
+            loadAnalytics();
+            return data;
+        } else {
+            console.error('Server reported failure saving bets:', data);
+            return null;
+        }
+    } catch (error) {
+        console.error('Error saving bets:', error);
+        return null;
+    }
+}
+
+// Bets whose POST /api/bets has not answered yet. They still carry a temporary
+// id, so their row actions stay disabled until the database id arrives
+const unsavedBets = new WeakSet();
+
+// Insert a new bet and swap its temporary id for the database id
+async function createBet(bet) {
+    const tempId = bet.id;
+    unsavedBets.add(bet);
+    const data = await betsRequest('POST', '/api/bets', bet);
+    unsavedBets.delete(bet);
+    if (!data) return false;
+    bet.id = data.id;
+
+    // Re-key the bet in whichever map holds it now; if none does (history was
+    // cleared meanwhile) the new row is orphaned on the server, so drop it
+    let held = false;
+    for (const byId of [activeBetsById, completedBetsById]) {
+        if (byId.get(tempId) === bet) {
+            byId.delete(tempId);
+            byId.set(bet.id, bet);
+            held = true;
+        }
+    }
+    if (!held) deleteBetOnServer(bet);
+
+    // Pooled rows skip refilling a bet they already show; forget them so a
+    // row drawn with the temporary id picks up the new data-bet-id
+    betRowBets.length = 0;
+    return true;
+}
+
+function patchBet(bet, changes) {
+    return betsRequest('PATCH', `/api/bets/${bet.id}`, changes, true);
+}
+
+function deleteBetOnServer(bet) {
+    return betsRequest('DELETE', `/api/bets/${bet.id}`, undefined, true);
+}
+
+// Update bets display
+function updateBetsDisplay() {
+    betsDirty = false;
+    refs.betsEmpty.style.display = activeBets.length === 0 ? '' : 'none';
+    renderBetsWindow();
+}
+
+// Virtualized bets list: only rows near the viewport exist, drawn from a pool
+const BET_OVERSCAN = 5;     // extra rows rendered above and below the viewport
+const betRowTemplate = document.getElementById('bet-row-tpl');
+const betRowPool = [];      // row nodes inside .bets-window, by slot
+const betRowBets = [];      // bet currently shown in each pooled row
+// Row pitch (.bet-row height + margin) and the list's top padding, measured
+// from the stylesheet since the mobile layout uses taller rows; 0 = measure
+let betRowHeight = 0;
+let betsListPadding = 0;
+
+function scheduleBetsWindow() {
+    if (betsScrollQueued || activeTab !== 'bets') return;
+    betsScrollQueued = true;
+    requestAnimationFrame(() => {
+        betsScrollQueued = false;
+        renderBetsWindow();
+    });
+}
+
+function measureBetRows() {
+    let row = betRowPool[0];
+    if (!row) {
+        row = createBetRow();
+        betRowPool.push(row);
+        refs.betsWindow.appendChild(row);
+    }
+    row.style.display = '';
+    betRowHeight = row.offsetHeight + parseFloat(getComputedStyle(row).marginBottom);
+    betsListPadding = parseFloat(getComputedStyle(refs.betsList).paddingTop);
+}
+
+// A resize can cross the mobile breakpoint, so measure the rows again,
+// now or when the bets tab is next shown
+function resizeBetsWindow() {
+    betRowHeight = 0;
+    markDirty(DIRTY_BETS);
+}
+
+function renderBetsWindow() {
+    const list = refs.betsList;
+    if (!betRowHeight) measureBetRows();
+    // Still 0 while the list is not laid out; draw nothing until it is
+    if (!betRowHeight) return;
+
+    refs.betsSpacer.style.height = `${activeBets.length * betRowHeight}px`;
+    // The spacer starts below the list's top padding
+    const offset = Math.max(0, list.scrollTop - betsListPadding);
+    const visibleRows = Math.ceil((list.clientHeight || window.innerHeight) / betRowHeight);
+    const start = Math.max(0, Math.floor(offset / betRowHeight) - BET_OVERSCAN);
+    const end = Math.min(activeBets.length, start + visibleRows + 2 * BET_OVERSCAN);
+
+    refs.betsWindow.style.transform = `translateY(${start * betRowHeight}px)`;
+
+    for (let i = start; i < end; i++) {
+        const slot = i - start;
+        let row = betRowPool[slot];
+        if (!row) {
+            row = createBetRow();
+            betRowPool.push(row);
+            refs.betsWindow.appendChild(row);
+        }
+        row.style.display = '';
+        if (betRowBets[slot] !== activeBets[i]) {
+            fillBetRow(row, activeBets[i]);
+            betRowBets[slot] = activeBets[i];
+        }
+    }
+
+    // Park pooled rows that are not needed for this slice
+    for (let slot = end - start; slot < betRowPool.length; slot++) {
+        betRowPool[slot].style.display = 'none';
+    }
+}
+
+function createBetRow() {
+    return betRowTemplate.content.firstElementChild.cloneNode(true);
+}
+
+function fillBetRow(row, bet) {
+    const game = bet.game;
+    const betTeam = bet.bet_team;
+    row.dataset.betId = bet.id;
+    row.querySelector('.bet-amount').textContent = `£${bet.stake.toFixed(2)} @ ${bet.odds.toFixed(3)}`;
+    const title = `${game} - ${betTeam}`;
+    const odds = row.querySelector('.bet-odds');
+    odds.textContent = title;
+    odds.title = title;
+    // No won/lost/delete until the bet has its database id
+    const pending = unsavedBets.has(bet);
+    for (const button of row.querySelectorAll('button[data-action]')) {
+        button.disabled = pending;
+    }
+}
+
+// Mark bet as won/lost
+function markBetWon(betId) {
+    settleBet(betId, 'won', 'Won');
+}
+
+function markBetLost(betId) {
+    settleBet(betId, 'lost', 'Lost');
+}
+
+// Settle locally, then PATCH the server; a failed request puts the bet back
+// where it was, since nothing later would reconcile the two sides
+async function settleBet(betId, status, result) {
+    const bet = activeBetsById.get(betId);
+    if (!bet) return;
+
+    const index = activeBets.indexOf(bet);
+    const previous = { status: bet.status, result: bet.result, profit: bet.profit };
+    aggApply(bet, -1);
+    bet.status = status;
+    bet.result = result;
+    bet.profit = calcProfit(bet.stake, bet.odds, bet.status);
+    completedBets.push(bet);
+    completedBetsById.set(betId, bet);
+    removeBet(activeBets, activeBetsById, bet);
+    aggApply(bet, 1);
+    markDirty(DIRTY_BETS | DIRTY_ANALYTICS | DIRTY_FILTERS);
+
+    // Skip the revert if the bet is gone by now (history cleared meanwhile)
+    if (!await patchBet(bet, { status }) && completedBetsById.get(betId) === bet) {
+        aggApply(bet, -1);
+        Object.assign(bet, previous);
+        removeBet(completedBets, completedBetsById, bet);
+        activeBets.splice(index, 0, bet);
+        activeBetsById.set(betId, bet);
+        aggApply(bet, 1);
+        markDirty(DIRTY_BETS | DIRTY_ANALYTICS | DIRTY_FILTERS);
+        alert('Failed to save the bet result to the server. Check server logs or try again.');
+    }
+}
+
+// Delete bet
+async function deleteBet(betId) {
+    if (confirm('Are you sure you want to delete this bet?')) {
+        const bet = activeBetsById.get(betId);
+        if (bet) {
+            const index = activeBets.indexOf(bet);
+            removeBet(activeBets, activeBetsById, bet);
+            aggApply(bet, -1);
+            rebuildBetKeySet();
+            markDirty(DIRTY_BETS | DIRTY_ANALYTICS | DIRTY_FILTERS);
+
+            const list = activeBets;
+            if (await deleteBetOnServer(bet)) {
+                alert('Bet deleted successfully!');
+            } else if (activeBets === list) {  // unless history was cleared meanwhile
+                // Revert the in-memory change
+                activeBets.splice(index, 0, bet);
+                activeBetsById.set(betId, bet);
+                aggApply(bet, 1);
+                rebuildBetKeySet();
+                markDirty(DIRTY_BETS | DIRTY_ANALYTICS | DIRTY_FILTERS);
+                alert('Failed to delete the bet on the server. Check server logs or try again.');
+            }
+        }
+    }
+}
+
+// Update analytics
+function roundPence(amount) {
+    return Math.round(amount * 100) / 100;
+}
+
+// Analytics render with the next UI flush, coalesced with any other pending redraws
+function updateAnalytics() {
+    markDirty(DIRTY_ANALYTICS);
+}
+
+function renderAnalytics() {
+    analyticsDirty = false;
+    dlog('updateAnalytics called');
+    // Totals come from the running agg; money sums are snapped to pence so
+    // float drift from repeated add/subtract never shows up as -0.00
+    const totalBets = activeBets.length + completedBets.length;
+    const completedBetsCount = agg.completedCount;
+    const wonBets = agg.wonCount;
+    const winRate = completedBetsCount > 0 ? Math.round((wonBets / completedBetsCount) * 100) : 0;
+    const totalStake = roundPence(agg.totalStake);
+    const totalProfit = roundPence(agg.totalProfit);
+
+    // Calculate pending bet stats
+    const pendingBetsCount = activeBets.length;
+    const pendingStake = roundPence(agg.pendingStake);
+    const potentialProfit = roundPence(agg.potentialProfit);
+
+    if (DEBUG) {
+        dlog('Analytics stats:', {
+            totalBets, completedBetsCount, wonBets, winRate,
+            totalStake, totalProfit, pendingBetsCount, pendingStake, potentialProfit
+        });
+    }
+
+    const settledStake = totalStake - pendingStake;
+    const totalROI = settledStake > 0 ? ((totalProfit / settledStake) * 100).toFixed(2) : 0;
+
+    // Write phase: all summary values are computed above, so nothing below reads layout
+    // Update settled bets section; setText leaves unchanged values alone
+    setText(refs.settledBets, String(completedBetsCount));
+    setText(refs.winRate, winRate + '%');
+    setText(refs.settledStake, '£' + settledStake.toFixed(2));
+    setText(refs.totalProfit, '£' + totalProfit.toFixed(2));
+
+    // Display ROI for settled bets, color coded (green for positive, red for negative)
+    setText(refs.totalRoi, totalROI + '%');
+    refs.totalRoi.style.color = totalROI >= 0 ? '#27ae60' : '#e74c3c';
+
+    // Update pending bets section
+    setText(refs.pendingBets, String(pendingBetsCount));
+    setText(refs.pendingStake, '£' + pendingStake.toFixed(2));
+    setText(refs.potentialProfit, '£' + potentialProfit.toFixed(2));
+    setText(refs.totalBets, String(totalBets));
+
+    // Update weekend-based analytics, unless no bet changed since they were drawn
+    if (_weekendsRenderedVersion !== betsVersion) {
+        updateRoundAnalytics();
+        _weekendsRenderedVersion = betsVersion;
+    }
+
+    // League breakdown and team rankings arrive precomputed from /api/analytics
+    if (serverAnalytics && _breakdownsRenderedVersion !== analyticsVersion) {
+        updateLeagueBreakdown(serverAnalytics.by_league);
+        updateTopBottomTeams(serverAnalytics.by_team_top, serverAnalytics.by_team_bottom);
+        _breakdownsRenderedVersion = analyticsVersion;
+    }
+}
+
+// Update weekend-based analytics; weekendStats is kept current by weekendApply
+function updateRoundAnalytics() {
+    // Update weekend analytics display
+    updateWeekendAnalyticsDisplay(weekendStats);
+
+    // Update performance summary
+    updatePerformanceSummary(weekendStats);
+}
+
+// Get weekend label from bet date; the label depends only on the string, so memoize it
+const _weekendLabelCache = new Map();
+const WEEKEND_LABEL_CACHE_MAX = 512;
+
+function getWeekendLabel(betDate) {
+    const cached = _weekendLabelCache.get(betDate);
+    if (cached !== undefined) return cached;
+
+    const label = _computeWeekendLabel(betDate);
+    // FIFO eviction keeps the memo bounded
+    if (_weekendLabelCache.size >= WEEKEND_LABEL_CACHE_MAX) {
+        _weekendLabelCache.delete(_weekendLabelCache.keys().next().value);
+    }
+    _weekendLabelCache.set(betDate, label);
+    return label;
+}
+
+// Zero-padded month and day of a date, e.g. { month: '09', day: '05' }
+const _monthDayFmt = new Intl.DateTimeFormat('en-GB', { month: '2-digit', day: '2-digit' });
+
+function _monthDay(date) {
+    const parts = {};
+    for (const { type, value } of _monthDayFmt.formatToParts(date)) parts[type] = value;
+    return parts;
+}
+
+function _computeWeekendLabel(betDate) {
+    if (betDate === 'Unknown' || !betDate) {
+        return 'Unknown Weekend';
+    }
+
+    try {
+        // Handle different date formats
+        let date;
+        if (betDate.includes('/')) {
+            // Handle DD/MM/YYYY format
+            const parts = betDate.split('/');
+            if (parts.length === 3) {
+                // Assume DD/MM/YYYY format
+                date = new Date(parts[2], parts[1] - 1, parts[0]);
+            } else {
+                date = new Date(betDate);
+            }
+        } else {
+            // Handle ISO format (YYYY-MM-DDTHH:mm:ss.sssZ)
+            date = new Date(betDate);
+        }
+
+        if (isNaN(date.getTime())) {
+            return 'Unknown Weekend';
+        }
+
+        // Days from this date to the Friday starting its weekend (Friday-Sunday);
+        // Saturday and Sunday belong to the weekend under way, other days to the next one
+        const dayOfWeek = date.getDay();
+        const toFriday = dayOfWeek === 6 ? -1 : dayOfWeek === 0 ? -2 : (5 - dayOfWeek + 7) % 7;
+
+        // Build the endpoints from calendar fields so DST changes can't shift the day
+        const year = date.getFullYear();
+        const month = date.getMonth();
+        const friday = date.getDate() + toFriday;
+        const start = _monthDay(new Date(year, month, friday));
+        const end = _monthDay(new Date(year, month, friday + 2));
+
+        if (start.month === end.month) {
+            return `${start.month}-${start.day} to ${end.day}`;
+        } else {
+            return `${start.month}-${start.day} to ${end.month}-${end.day}`;
+        }
+    } catch (e) {
+        return 'Unknown Weekend';
+    }
+}
+
+// Update weekend analytics display
+function updateWeekendAnalyticsDisplay(weekendStats) {
+    const container = refs.roundAnalytics;
+    dlog('updateWeekendAnalyticsDisplay called, container:', container);
+    dlog('weekendStats:', weekendStats);
+    if (!container) {
+        dlog('round-analytics container not found!');
+        return;
+    }
+
+    const weekends = Object.keys(weekendStats).sort((a, b) => {
+        // Sort weekends chronologically
+        if (a === 'Unknown Weekend') return 1;
+        if (b === 'Unknown Weekend') return -1;
+
+        // Extract dates for comparison
+        const aDate = weekendStats[a].matchDate;
+        const bDate = weekendStats[b].matchDate;
+
+        if (aDate === 'Unknown' || bDate === 'Unknown') {
+            return a.localeCompare(b);
+        }
+
+        return new Date(aDate) - new Date(bDate);
+    });
+
+    if (!weekendGrid) {
+        weekendGrid = document.createElement('div');
+        weekendGrid.className = 'round-analytics-grid';
+        container.replaceChildren(weekendGrid);
+    }
+
+    // Create cards for new weekends, update the rest in place and keep them in order
+    let cursor = weekendGrid.firstChild;
+    weekends.forEach(weekend => {
+        let card = weekendCardCache.get(weekend);
+        if (!card) {
+            card = createWeekendCard(weekend);
+            weekendCardCache.set(weekend, card);
+        }
+        updateWeekendCard(card, weekend, weekendStats[weekend]);
+        if (card.root === cursor) {
+            cursor = cursor.nextSibling;
+        } else {
+            weekendGrid.insertBefore(card.root, cursor);
+        }
+    });
+
+    // Drop cards for weekends that no longer have bets
+    for (const [weekend, card] of weekendCardCache) {
+        if (!Object.hasOwn(weekendStats, weekend)) {
+            card.root.remove();
+            weekendCardCache.delete(weekend);
+        }
+    }
+}
+
+// Weekend analytics cards, keyed by weekend label
+const weekendCardTemplate = document.getElementById('weekend-card-tpl');
+const weekendCardCache = new Map();  // weekend label -> { root, refs }
+let weekendGrid = null;              // .round-analytics-grid inside #round-analytics
+
+function createWeekendCard(weekend) {
+    const root = weekendCardTemplate.content.firstElementChild.cloneNode(true);
+    const field = name => root.querySelector(`[data-field="${name}"]`);
+    root.dataset.weekend = weekend;
+    root.querySelector('.round-title').textContent = weekend;
+    return {
+        root,
+        refs: {
+            status: root.querySelector('.round-status'),
+            leagues: root.querySelector('.weekend-leagues'),
+            bets: field('bets'),
+            winRate: field('winRate'),
+            stake: field('stake'),
+            profit: field('profit'),
+            roi: field('roi'),
+            expandBtn: root.querySelector('.weekend-expand-btn'),
+            betsContainer: root.querySelector('.weekend-bets-container')
+        }
+    };
+}
+
+// Only touch text nodes whose value changed
+function setText(el, text) {
+    if (el.textContent !== text) el.textContent = text;
+}
+
+function updateWeekendCard(card, weekend, stats) {
+    const el = card.refs;
+    const winRate = stats.completedBets > 0 ? Math.round((stats.wonBets / stats.completedBets) * 100) : 0;
+    const weekendROI = stats.totalStake > 0 ? ((stats.totalProfit / stats.totalStake) * 100).toFixed(2) : 0;
+    const active = stats.activeBets > 0;
+
+    setText(el.status, active ? 'Active' : 'Completed');
+    el.status.className = active ? 'round-status active' : 'round-status completed';
+    setText(el.leagues, Array.from(stats.leagues.keys()).join(', ') || 'Unknown Leagues');
+    setText(el.bets, String(stats.totalBets));
+    setText(el.winRate, `${winRate}%`);
+    setText(el.stake, `£${stats.totalStake.toFixed(2)}`);
+    setText(el.profit, `£${stats.totalProfit.toFixed(2)}`);
+    el.profit.className = stats.totalProfit >= 0 ? 'stat-value profit-positive' : 'stat-value profit-negative';
+    setText(el.roi, `${weekendROI}%`);
+    el.roi.className = weekendROI >= 0 ? 'stat-value profit-positive' : 'stat-value profit-negative';
+    setText(el.expandBtn, `📋 View Bets (${stats.totalBets})`);
+
+    // Keep an expanded bets list in step with the card
+    if (el.betsContainer.style.display === 'block') {
+        renderWeekendBets(el.betsContainer, weekend);
+    }
+}
+
+// Toggle and display bets for a weekend card
+function toggleWeekendBets(card) {
+    const container = card.querySelector('.weekend-bets-container');
+
+    // If already visible, hide it
+    if (container.style.display === 'block') {
+        container.style.display = 'none';
+        container.innerHTML = '';
+        return;
+    }
+
+    renderWeekendBets(container, card.dataset.weekend);
+    container.style.display = 'block';
+}
+
+// Fill a weekend card's bets container with the bets placed that weekend
+const weekendBetTemplate = document.getElementById('weekend-bet-tpl');
+
+function renderWeekendBets(container, weekendLabel) {
+    try {
+        // Bets are already grouped by weekend in weekendStats
+        const betsForWeekend = weekendStats[weekendLabel]?.bets;
+
+        if (!betsForWeekend || betsForWeekend.size === 0) {
+            container.innerHTML = '<p style="padding:12px;">No bets for this weekend.</p>';
+            return;
+        }
+
+        // Clone one template row per bet and fill it through textContent
+        const list = document.createElement('div');
+        list.className = 'weekend-bets-list';
+        betsForWeekend.forEach(bet => {
+            const game = bet.game;
+            const team = bet.bet_team;
+            const stake = typeof bet.stake === 'number' ? `£${bet.stake.toFixed(2)}` : (bet.stake || '£0.00');
+            const odds = typeof bet.odds === 'number' ? bet.odds.toFixed(3) : (bet.odds || 'N/A');
+            const status = (bet.status || 'pending').toLowerCase();
+            const profit = typeof bet.profit === 'number' ? `£${bet.profit.toFixed(2)}` : (bet.profit || '£0.00');
+            const placement = formatDateForDisplay(bet.placement_date || bet.date || bet.match_date || 'Unknown');
+
+            let statusClass = 'weekend-bet-status status-pending';
+            if (status === 'won') statusClass = 'weekend-bet-status status-won';
+            if (status === 'lost') statusClass = 'weekend-bet-status status-lost';
+
+            const item = weekendBetTemplate.content.firstElementChild.cloneNode(true);
+            item.querySelector('.weekend-bet-game').textContent = game;
+            item.querySelector('.weekend-bet-team').textContent = team;
+            item.querySelector('.weekend-bet-meta').textContent = `Placed: ${placement}`;
+            item.querySelector('.weekend-bet-stake').textContent = `${stake} @ ${odds}`;
+            const profitEl = item.querySelector('.weekend-bet-profit');
+            profitEl.textContent = profit;
+            profitEl.classList.add(profit.startsWith('-') ? 'profit-negative' : 'profit-positive');
+            const statusEl = item.querySelector('.weekend-bet-status');
+            statusEl.className = statusClass;
+            statusEl.textContent = status.charAt(0).toUpperCase() + status.slice(1);
+            list.appendChild(item);
+        });
+
+        container.replaceChildren(list);
+    } catch (e) {
+        console.error('Error rendering weekend bets for', weekendLabel, e);
+    }
+}
+
+// Update performance summary
+function updatePerformanceSummary(weekendStats) {
+    const container = refs.perfSummary;
+    dlog('updatePerformanceSummary called, container:', container);
+    dlog('weekendStats:', weekendStats);
+    if (!container) {
+        dlog('performance-summary-content container not found!');
+        return;
+    }
+
+    const weekends = Object.keys(weekendStats);
+    if (weekends.length === 0) {
+        container.innerHTML = '<p>No betting data available yet.</p>';
+        return;
+    }
+
+    // Calculate overall stats
+    let totalBets = 0;
+    let totalWonBets = 0;
+    let totalStake = 0;
+    let totalProfit = 0;
+    let totalActiveBets = 0;
+    let totalCompletedBets = 0;
+    // Best and worst weekends by profit are tracked in the same pass; on a tie the earlier one wins
+    let bestWeekend = weekends[0];
+    let bestProfit = weekendStats[bestWeekend].totalProfit;
+    let worstWeekend = bestWeekend;
+    let worstProfit = bestProfit;
+
+    weekends.forEach(weekend => {
+        const stats = weekendStats[weekend];
+        totalBets += stats.totalBets;
+        totalWonBets += stats.wonBets;
+        totalStake += stats.totalStake;
+        totalProfit += stats.totalProfit;
+        totalActiveBets += stats.activeBets;
+        totalCompletedBets += stats.completedBets;
+        if (stats.totalProfit > bestProfit) {
+            bestWeekend = weekend;
+            bestProfit = stats.totalProfit;
+        }
+        if (stats.totalProfit < worstProfit) {
+            worstWeekend = weekend;
+            worstProfit = stats.totalProfit;
+        }
+    });
+
+    const overallWinRate = totalCompletedBets > 0 ? Math.round((totalWonBets / totalCompletedBets) * 100) : 0;
+    const avgProfitPerWeekend = weekends.length > 0 ? totalProfit / weekends.length : 0;
+    const bestWeekendStr = `${bestWeekend} (£${bestProfit.toFixed(2)})`;
+    const worstWeekendStr = `${worstWeekend} (£${worstProfit.toFixed(2)})`;
+
+    const profitClass = totalProfit >= 0 ? 'profit-positive' : 'profit-negative';
+    const avgProfitClass = avgProfitPerWeekend >= 0 ? 'profit-positive' : 'profit-negative';
+
+    // Calculate ROI metrics
+    const overallROI = totalStake > 0 ? ((totalProfit / totalStake) * 100).toFixed(2) : 0;
+    const overallROIClass = overallROI >= 0 ? 'profit-positive' : 'profit-negative';
+    const avgROIPerWeekend = weekends.length > 0 ? (overallROI / weekends.length).toFixed(2) : 0;
+    const avgROIClass = avgROIPerWeekend >= 0 ? 'profit-positive' : 'profit-negative';
+
+    const html = `
+        <div class="performance-grid">
+            <div class="performance-card">
+                <h4 class="performance-title">Overall Statistics</h4>
+                <div class="performance-stats">
+                    <div class="perf-stat">
+                        <span class="perf-label">Total Weekends:</span>
+                        <span class="perf-value">${weekends.length}</span>
+                    </div>
+                    <div class="perf-stat">
+                        <span class="perf-label">Total Bets:</span>
+                        <span class="perf-value">${totalBets}</span>
+                    </div>
+                    <div class="perf-stat">
+                        <span class="perf-label">Win Rate:</span>
+                        <span class="perf-value">${overallWinRate}%</span>
+                    </div>
+                    <div class="perf-stat">
+                        <span class="perf-label">Total Stake:</span>
+                        <span class="perf-value">£${totalStake.toFixed(2)}</span>
+                    </div>
+                    <div class="perf-stat">
+                        <span class="perf-label">Total Profit:</span>
+                        <span class="perf-value ${profitClass}">£${totalProfit.toFixed(2)}</span>
+                    </div>
+                    <div class="perf-stat">
+                        <span class="perf-label">Avg Profit/Weekend:</span>
+                        <span class="perf-value ${avgProfitClass}">£${avgProfitPerWeekend.toFixed(2)}</span>
+                    </div>
+                    <div class="perf-stat">
+                        <span class="perf-label">Total ROI:</span>
+                        <span class="perf-value ${overallROIClass}">${overallROI}%</span>
+                    </div>
+                    <div class="perf-stat">
+                        <span class="perf-label">Avg ROI/Weekend:</span>
+                        <span class="perf-value ${avgROIClass}">${avgROIPerWeekend}%</span>
+                    </div>
+                    <div class="perf-stat">
+                        <span class="perf-label">Best Weekend:</span>
+                        <span class="perf-value">${bestWeekendStr}</span>
+                    </div>
+                    <div class="perf-stat perf-stat-last">
+                        <span class="perf-label">Worst Weekend:</span>
+                        <span class="perf-value">${worstWeekendStr}</span>
+                    </div>
+                </div>
+            </div>
+        </div>
+    `;
+
+    container.innerHTML = html;
+}
+
+// League Breakdown Analysis
+function updateLeagueBreakdown(leagues) {
+    const rows = leagues.map(leagueRow);
+    syncStatsCards(refs.leagueBreakdown, leagueCardCache, leagueCardTemplate,
+        rows.map(row => row.league),
+        (card, league, index) => fillLeagueCard(card, rows[index]),
+        'No league data available yet.');
+}
+
+// Format one by_league entry, so filling its card is plain string assignment
+function leagueRow(entry) {
+    return {
+        league: entry.league,
+        betsStr: String(entry.bets),
+        winRateStr: `${entry.win_rate}%`,
+        stakeStr: `£${entry.stake.toFixed(2)}`,
+        profitStr: `£${entry.profit.toFixed(2)}`,
+        roiStr: `${entry.roi.toFixed(2)}%`,
+        profitClass: entry.profit >= 0 ? 'stats-value positive' : 'stats-value negative',
+        roiClass: entry.roi >= 0 ? 'stats-value positive' : 'stats-value negative'
+    };
+}
+
+// League and team cards are created once per key and updated in place
+const leagueCardTemplate = document.getElementById('league-card-tpl');
+const teamCardTemplate = document.getElementById('team-card-tpl');
+const leagueCardCache = new Map();  // league name -> { root, refs }
+const topTeamCards = new Map();     // rank index -> { root, refs }
+const bottomTeamCards = new Map();  // rank index -> { root, refs }
+
+function createStatsCard(template) {
+    const root = template.content.firstElementChild.cloneNode(true);
+    const refs = { title: root.querySelector('.stats-card-title') };
+    root.querySelectorAll('[data-field]').forEach(el => {
+        refs[el.dataset.field] = el;
+    });
+    return { root, refs };
+}
+
+// Show one card per key in order: new keys get a card, existing cards are
+// refilled and moved if needed, and cards for keys that are gone are dropped
+function syncStatsCards(container, cache, template, keys, fill, emptyText) {
+    if (keys.length === 0) {
+        cache.clear();
+        const empty = document.createElement('p');
+        empty.textContent = emptyText;
+        container.replaceChildren(empty);
+        return;
+    }
+
+    // Coming from the placeholder (or the initial markup) start from an empty panel
+    if (cache.size === 0) container.replaceChildren();
+
+    const live = new Set(keys);
+    let cursor = container.firstChild;
+    keys.forEach((key, index) => {
+        let card = cache.get(key);
+        if (!card) {
+            card = createStatsCard(template);
+            cache.set(key, card);
+        }
+        fill(card, key, index);
+        if (card.root === cursor) {
+            cursor = cursor.nextSibling;
+        } else {
+            container.insertBefore(card.root, cursor);
+        }
+    });
+
+    for (const [key, card] of cache) {
+        if (!live.has(key)) {
+            card.root.remove();
+            cache.delete(key);
+        }
+    }
+}
+
+function fillLeagueCard(card, stats) {
+    const el = card.refs;
+    setText(el.title, stats.league);
+    setText(el.bets, stats.betsStr);
+    setText(el.winRate, stats.winRateStr);
+    setText(el.stake, stats.stakeStr);
+    setText(el.profit, stats.profitStr);
+    el.profit.className = stats.profitClass;
+    setText(el.roi, stats.roiStr);
+    el.roi.className = stats.roiClass;
+}
+
+function fillTeamCard(card, team, index) {
+    const el = card.refs;
+    setText(el.title, `${index + 1}. ${team.team}`);
+    setText(el.bets, team.betsStr);
+    setText(el.stake, team.stakeStr);
+    setText(el.profit, team.profitStr);
+    el.profit.className = team.profitClass;
+    setText(el.roi, team.roiStr);
+    el.roi.className = team.profitClass;
+}
+
+// Top and Bottom Teams Analysis
+// Format one by_team_top/by_team_bottom entry for its card
+function teamRow(entry) {
+    return {
+        team: entry.team,
+        betsStr: String(entry.bets),
+        stakeStr: `£${entry.stake.toFixed(2)}`,
+        profitStr: `£${entry.profit.toFixed(2)}`,
+        roiStr: `${entry.roi.toFixed(2)}%`,
+        profitClass: entry.profit >= 0 ? 'stats-value positive' : 'stats-value negative'
+    };
+}
+
+function updateTopBottomTeams(topEntries, bottomEntries) {
+    const topTeams = topEntries.map(teamRow);
+    const bottomTeams = bottomEntries.map(teamRow);
+
+    // Display top and bottom teams, one card per rank
+    syncStatsCards(refs.topTeams, topTeamCards, teamCardTemplate,
+        topTeams.map((team, index) => index),
+        (card, index) => fillTeamCard(card, topTeams[index], index),
+        'No team data available yet.');
+    syncStatsCards(refs.bottomTeams, bottomTeamCards, teamCardTemplate,
+        bottomTeams.map((team, index) => index),
+        (card, index) => fillTeamCard(card, bottomTeams[index], index),
+        'No team data available yet.');
+}
+
+// Test function to debug analytics
+function testAnalytics() {
+    console.log('Testing analytics...');
+    console.log('activeBets:', activeBets);
+    console.log('completedBets:', completedBets);
+    updateAnalytics();
+}
+
+// Make testAnalytics available globally
+window.testAnalytics = testAnalytics;
+
+// Calculate P&L
+function calculatePnL() {
+    const totalProfit = roundPence(agg.totalProfit);
+    const pendingValue = roundPence(agg.pendingStake);
+
+    alert(`P&L Summary:\n\nCompleted Bets Profit: £${totalProfit.toFixed(2)}\nPending Bets Value: £${pendingValue.toFixed(2)}\n\nTotal Potential: £${(totalProfit + pendingValue).toFixed(2)}`);
+}
+
+// Clear all betting history
+async function clearAllHistory() {
+    const totalBets = activeBets.length + completedBets.length;
+
+    if (totalBets === 0) {
+        alert('No betting history to clear!');
+        return;
+    }
+
+    const confirmMessage = `Are you sure you want to clear ALL betting history?\n\nThis will delete:\n• ${activeBets.length} active bets\n• ${completedBets.length} completed bets\n\nThis action cannot be undone!`;
+
+    if (confirm(confirmMessage)) {
+        // Clear all data
+        activeBets = [];
+        completedBets = [];
+        rebuildBetMaps();
+        rebuildAgg();
+        rebuildBetKeySet();
+
+        markDirty(DIRTY_BETS | DIRTY_ANALYTICS | DIRTY_FILTERS);
+
+        // Posting an empty list removes every bet on the server; if that
+        // fails, reload what the server still has instead of showing nothing
+        if (await betsRequest('POST', '/api/bets', [])) {
+            alert('✅ All betting history has been cleared successfully!');
+        } else {
+            await loadBets();
+            markDirty(DIRTY_BETS | DIRTY_ANALYTICS | DIRTY_FILTERS);
+            alert('Failed to clear the betting history on the server. Check server logs or try again.');
+        }
+    }
+}
+
+// Show error
+function showError(message) {
+    const container = refs.tabs.opportunities.content;
+    container.innerHTML = `
+        <div class="error">
+            <h3>❌ Error Loading Opportunities</h3>
+            <p>${message}</p>
+        </div>
+    `;
+}